@@ -1,5 +1,6 @@
 use crate::commands::PdfCommand;
 use crate::pdf_engine::{DocumentStore, SharedRenderCache, create_render_cache};
+use rayon::prelude::*;
 use std::collections::HashMap;
 use std::sync::{Arc, RwLock};
 use tokio::sync::mpsc;
@@ -220,24 +221,42 @@ pub fn spawn_engine_thread(cache_size: u64, max_memory_mb: u64) -> EngineState {
                         }
                         let store_ref = std::panic::AssertUnwindSafe(&store);
                         let res = catch_worker_panic("export_images", move || {
-                            let mut output_paths = Vec::new();
-                            for page_num in pages {
-                                let safe_name = format!("page_{page_num}.png");
-                                let out_file = out_path.join(&safe_name);
-                                if let Ok(buf) =
-                                    store_ref.export_page_as_image(doc_id, page_num, scale)
-                                {
-                                    let optimized = oxipng::optimize_from_memory(
-                                        &buf,
-                                        &oxipng::Options::default(),
-                                    )
-                                    .unwrap_or(buf);
-                                    if std::fs::write(&out_file, optimized).is_ok()
-                                        && let Some(path_str) = out_file.to_str()
-                                    {
-                                        output_paths.push(path_str.to_string());
-                                    }
-                                }
+                            // Options are identical for every page; build them once
+                            // instead of re-constructing inside the loop.
+                            let png_options = oxipng::Options::default();
+                            // Rendering stays on this worker thread (the store is
+                            // not shared), but PNG optimization and the file writes
+                            // are independent per page — run them on the rayon pool
+                            // so compression and I/O overlap across cores. Pages
+                            // are processed one pool-width chunk at a time so only
+                            // that many raw renders are ever held in memory,
+                            // regardless of document size or zoom.
+                            let chunk_len = rayon::current_num_threads().max(1);
+                            let mut output_paths = Vec::with_capacity(pages.len());
+                            for chunk in pages.chunks(chunk_len) {
+                                let rendered: Vec<(usize, Vec<u8>)> = chunk
+                                    .iter()
+                                    .filter_map(|&page_num| {
+                                        store_ref
+                                            .export_page_as_image(doc_id, page_num, scale)
+                                            .ok()
+                                            .map(|buf| (page_num, buf))
+                                    })
+                                    .collect();
+                                output_paths.par_extend(rendered.into_par_iter().filter_map(
+                                    |(page_num, buf)| {
+                                        let out_file =
+                                            out_path.join(format!("page_{page_num}.png"));
+                                        let optimized =
+                                            oxipng::optimize_from_memory(&buf, &png_options)
+                                                .unwrap_or(buf);
+                                        if std::fs::write(&out_file, optimized).is_ok() {
+                                            out_file.to_str().map(ToString::to_string)
+                                        } else {
+                                            None
+                                        }
+                                    },
+                                ));
                             }
                             Ok(output_paths)
                         });
@@ -5,7 +5,7 @@ use crate::models::{
 use lopdf::{Document, Object, ObjectId};
 use quick_cache::{Weighter, sync::Cache};
 use rayon::prelude::*;
-use std::collections::HashMap;
+use std::collections::{HashMap, HashSet};
 use std::fmt::Write;
 use std::sync::Arc;
 use zpdf::{
@@ -111,11 +111,31 @@ pub struct RenderOptions {
     pub quality: RenderQuality,
 }
 
+#[derive(Clone)]
+struct SpanWeighter;
+
+impl Weighter<(DocumentId, usize), Arc<Vec<zpdf::TextSpan>>> for SpanWeighter {
+    fn weight(&self, _key: &(DocumentId, usize), val: &Arc<Vec<zpdf::TextSpan>>) -> u64 {
+        val.iter()
+            .map(|s| s.text.len() as u64 + 48)
+            .sum::<u64>()
+            .max(1)
+    }
+}
+
+/// Maximum memory for memoized per-page text spans (see `page_spans`).
+const SPAN_CACHE_MAX_BYTES: u64 = 32 * 1024 * 1024;
+
 pub struct DocumentStore {
     documents: HashMap<DocumentId, PdfDocument>,
     paths: HashMap<DocumentId, String>,
     render_cache: SharedRenderCache,
-    cache_keys: HashMap<DocumentId, Vec<RenderKey>>,
+    /// Render-cache keys issued per document, deduplicated: a page that is
+    /// evicted and re-rendered re-registers the same key, so a Vec would grow
+    /// without bound over a long session.
+    cache_keys: HashMap<DocumentId, HashSet<RenderKey>>,
+    /// Memoized text spans per (document, page), shared by repeated searches.
+    span_cache: Cache<(DocumentId, usize), Arc<Vec<zpdf::TextSpan>>, SpanWeighter>,
     /// Base `OcConfig` as decoded from the document (read-only after load).
     oc_configs: HashMap<DocumentId, zpdf::OcConfig>,
     /// Per-document user visibility overrides applied on top of `oc_configs`.
@@ -132,6 +152,7 @@ impl DocumentStore {
             paths: HashMap::new(),
             render_cache: cache,
             cache_keys: HashMap::new(),
+            span_cache: Cache::with_weighter(256, SPAN_CACHE_MAX_BYTES, SpanWeighter),
             oc_configs: HashMap::new(),
             oc_visibility: HashMap::new(),
         }
@@ -847,7 +868,7 @@ impl DocumentStore {
         self.cache_keys
             .entry(doc_id)
             .or_default()
-            .push(cache_key.clone());
+            .insert(cache_key.clone());
         self.render_cache.put(cache_key, base.clone());
 
         if options.filter == RenderFilter::None {
@@ -1336,6 +1357,50 @@ impl DocumentStore {
         }
     }
 
+    /// Extract the text spans of a page, memoized per (document, page).
+    /// Every search query used to re-run the content interpreter over every
+    /// page; the spans are identical between queries, so later queries become
+    /// a cache lookup. Document ids are never reused (`models::next_doc_id`),
+    /// so entries for closed documents can only age out, never serve stale data.
+    fn page_spans(
+        &self,
+        doc_id: DocumentId,
+        page_num: usize,
+    ) -> PdfResult<Arc<Vec<zpdf::TextSpan>>> {
+        let key = (doc_id, page_num);
+        if let Some(spans) = self.span_cache.get(&key) {
+            return Ok(spans);
+        }
+
+        let doc = self
+            .documents
+            .get(&doc_id)
+            .ok_or(PdfError::EngineError(EngineErrorKind::DocumentNotFound))?;
+        let page = doc
+            .page(page_num)
+            .map_err(|_| PdfError::PageNotFound(page_num))?;
+        let mut fonts = doc.load_page_fonts(&page);
+        let mut images = ImageCache::new();
+        let content = doc
+            .page_content_bytes(&page)
+            .map_err(|e| PdfError::SearchError(e.to_string()))?;
+
+        let mut spans: Vec<zpdf::TextSpan> = Vec::new();
+        {
+            let interp = ContentInterpreter::new(page.effective_box())
+                .with_page_rotation(page.rotate)
+                .with_fonts(&mut fonts)
+                .with_document(doc.file(), &page.resources)
+                .with_images(&mut images)
+                .with_text_sink(&mut spans);
+            let _ = interp.interpret(&content);
+        }
+
+        let spans = Arc::new(spans);
+        self.span_cache.insert(key, spans.clone());
+        Ok(spans)
+    }
+
     pub fn search(&self, doc_id: DocumentId, query: &str) -> PdfResult<Vec<SearchResultItem>> {
         let doc = self
             .documents
@@ -1350,26 +1415,16 @@ impl DocumentStore {
             let Ok(page) = doc.page(page_idx) else {
                 continue;
             };
-            let mut fonts = doc.load_page_fonts(&page);
-            let mut images = ImageCache::new();
-            let Ok(content) = doc.page_content_bytes(&page) else {
+            let eff_box = page.effective_box();
+            let Ok(spans) = self.page_spans(doc_id, page_idx) else {
                 continue;
             };
 
-            let mut spans: Vec<zpdf::TextSpan> = Vec::new();
-            let eff_box = page.effective_box();
-            {
-                let interp = ContentInterpreter::new(eff_box)
-                    .with_page_rotation(page.rotate)
-                    .with_fonts(&mut fonts)
-                    .with_document(doc.file(), &page.resources)
-                    .with_images(&mut images)
-                    .with_text_sink(&mut spans);
-                let _ = interp.interpret(&content);
-            }
-
-            let mut full_text = String::new();
-            let mut span_offsets = Vec::new();
+            // Reserve the final size up front so the concatenation loop never
+            // reallocates the growing buffer.
+            let text_len: usize = spans.iter().map(|s| s.text.len()).sum();
+            let mut full_text = String::with_capacity(text_len);
+            let mut span_offsets = Vec::with_capacity(spans.len());
 
             for (idx, span) in spans.iter().enumerate() {
                 let start = full_text.len();
@@ -1379,45 +1434,72 @@ impl DocumentStore {
             }
 
             let full_text_lower = full_text.to_lowercase();
-            let char_boundaries: Vec<usize> = full_text
-                .char_indices()
-                .map(|(idx, _)| idx)
-                .chain(std::iter::once(full_text.len()))
-                .collect();
-            let char_boundaries_lower: Vec<usize> = full_text_lower
-                .char_indices()
-                .map(|(idx, _)| idx)
-                .chain(std::iter::once(full_text_lower.len()))
-                .collect();
+            // For ASCII text lowercasing is byte-for-byte, so offsets in the
+            // lowered text map 1:1 onto the original and the two boundary
+            // tables (one usize per character) never need to be built.
+            let is_ascii = full_text.is_ascii();
+            let (char_boundaries, char_boundaries_lower) = if is_ascii {
+                (Vec::new(), Vec::new())
+            } else {
+                (
+                    full_text
+                        .char_indices()
+                        .map(|(idx, _)| idx)
+                        .chain(std::iter::once(full_text.len()))
+                        .collect::<Vec<usize>>(),
+                    full_text_lower
+                        .char_indices()
+                        .map(|(idx, _)| idx)
+                        .chain(std::iter::once(full_text_lower.len()))
+                        .collect::<Vec<usize>>(),
+                )
+            };
 
             let mut search_idx = 0;
             while let Some(pos) = full_text_lower[search_idx..].find(&query_lower) {
                 let match_start = search_idx + pos;
                 let match_end = match_start + query_lower.len();
 
-                // Get char index in full_text_lower:
-                let char_start = char_boundaries_lower
-                    .binary_search(&match_start)
-                    .unwrap_or_else(|x| x);
-                let char_end = char_boundaries_lower
-                    .binary_search(&match_end)
-                    .unwrap_or_else(|x| x);
-
-                // Map to byte index in original full_text:
-                let orig_start = char_boundaries
-                    .get(char_start)
-                    .copied()
-                    .unwrap_or(full_text.len());
-                let orig_end = char_boundaries
-                    .get(char_end)
-                    .copied()
-                    .unwrap_or(full_text.len());
+                let (orig_start, orig_end, next_search_idx) = if is_ascii {
+                    (match_start, match_end, match_start + 1)
+                } else {
+                    // Get char index in full_text_lower:
+                    let char_start = char_boundaries_lower
+                        .binary_search(&match_start)
+                        .unwrap_or_else(|x| x);
+                    let char_end = char_boundaries_lower
+                        .binary_search(&match_end)
+                        .unwrap_or_else(|x| x);
+
+                    // Map to byte index in original full_text:
+                    let orig_start = char_boundaries
+                        .get(char_start)
+                        .copied()
+                        .unwrap_or(full_text.len());
+                    let orig_end = char_boundaries
+                        .get(char_end)
+                        .copied()
+                        .unwrap_or(full_text.len());
+                    // Next character boundary in full_text_lower:
+                    let next = char_boundaries_lower
+                        .get(char_start + 1)
+                        .copied()
+                        .unwrap_or(full_text_lower.len());
+                    (orig_start, orig_end, next)
+                };
                 let matched_text = full_text[orig_start..orig_end].to_string();
 
-                if let Some(&(_, _, span_idx)) = span_offsets
-                    .iter()
-                    .find(|(s, e, _)| orig_start >= *s && orig_start < *e)
-                {
+                // span_offsets is sorted by start offset (spans are appended
+                // contiguously), so the containing span is found by binary
+                // search instead of a linear scan for every match.
+                let containing_span = span_offsets
+                    .partition_point(|&(s, _, _)| s <= orig_start)
+                    .checked_sub(1)
+                    .and_then(|i| {
+                        let (s, e, span_idx) = span_offsets[i];
+                        (orig_start >= s && orig_start < e).then_some(span_idx)
+                    });
+                if let Some(span_idx) = containing_span {
                     let first_span = &spans[span_idx];
                     let y_top_down = (eff_box.y1 - first_span.y - first_span.size as f64) as f32;
                     let x_left = (first_span.x - eff_box.x0) as f32;
@@ -1435,10 +1517,7 @@ impl DocumentStore {
                 }
 
                 // Advance search_idx safely to the next character boundary in full_text_lower
-                search_idx = char_boundaries_lower
-                    .get(char_start + 1)
-                    .copied()
-                    .unwrap_or(full_text_lower.len());
+                search_idx = next_search_idx;
             }
         }
 
@@ -1453,56 +1532,33 @@ impl DocumentStore {
         if width == 0 || height == 0 {
             return None;
         }
+        let is_content = |pixel: &[u8]| {
+            pixel[0] <= WHITE_THRESHOLD
+                || pixel[1] <= WHITE_THRESHOLD
+                || pixel[2] <= WHITE_THRESHOLD
+        };
+        // Scan whole rows at a time: only the first and last content pixel of
+        // a row can extend the bounding box, so position/rposition replace the
+        // per-pixel x/y arithmetic and min/max updates of a flat pixel loop.
+        let scan_row = |(y, row): (usize, &[u8])| -> Option<(u32, u32, u32, u32)> {
+            let first = row.chunks_exact(4).position(is_content)?;
+            let last = row.chunks_exact(4).rposition(is_content).unwrap_or(first);
+            Some((first as u32, y as u32, last as u32, y as u32))
+        };
+        let merge = |a: (u32, u32, u32, u32), b: (u32, u32, u32, u32)| {
+            (a.0.min(b.0), a.1.min(b.1), a.2.max(b.2), a.3.max(b.3))
+        };
+        let row_bytes = (width * 4) as usize;
         let bbox = if data.len() < 64 * 1024 {
-            let mut acc: Option<(u32, u32, u32, u32)> = None;
-            for (idx, pixel) in data.chunks_exact(4).enumerate() {
-                if pixel[0] <= WHITE_THRESHOLD
-                    || pixel[1] <= WHITE_THRESHOLD
-                    || pixel[2] <= WHITE_THRESHOLD
-                {
-                    let x = (idx as u32) % width;
-                    let y = (idx as u32) / width;
-                    if let Some((min_x, min_y, max_x, max_y)) = acc {
-                        acc = Some((min_x.min(x), min_y.min(y), max_x.max(x), max_y.max(y)));
-                    } else {
-                        acc = Some((x, y, x, y));
-                    }
-                }
-            }
-            acc
+            data.chunks_exact(row_bytes)
+                .enumerate()
+                .filter_map(scan_row)
+                .reduce(merge)
         } else {
-            data.par_chunks_exact(4)
+            data.par_chunks_exact(row_bytes)
                 .enumerate()
-                .fold(
-                    || None::<(u32, u32, u32, u32)>,
-                    |acc, (idx, pixel)| {
-                        if pixel[0] <= WHITE_THRESHOLD
-                            || pixel[1] <= WHITE_THRESHOLD
-                            || pixel[2] <= WHITE_THRESHOLD
-                        {
-                            let x = (idx as u32) % width;
-                            let y = (idx as u32) / width;
-                            if let Some((min_x, min_y, max_x, max_y)) = acc {
-                                Some((min_x.min(x), min_y.min(y), max_x.max(x), max_y.max(y)))
-                            } else {
-                                Some((x, y, x, y))
-                            }
-                        } else {
-                            acc
-                        }
-                    },
-                )
-                .reduce(
-                    || None,
-                    |a, b| match (a, b) {
-                        (Some(a), Some(b)) => {
-                            Some((a.0.min(b.0), a.1.min(b.1), a.2.max(b.2), a.3.max(b.3)))
-                        }
-                        (Some(a), None) => Some(a),
-                        (None, Some(b)) => Some(b),
-                        (None, None) => None,
-                    },
-                )
+                .filter_map(scan_row)
+                .reduce_with(merge)
         };
 
         bbox.map(|(min_x, min_y, max_x, max_y)| {
@@ -1515,7 +1571,6 @@ impl DocumentStore {
         })
     }
 
-    #[allow(clippy::suboptimal_flops)]
     pub fn apply_filter(data: &mut [u8], filter: RenderFilter) {
         match filter {
             RenderFilter::Inverted => {
@@ -1565,12 +1620,14 @@ impl DocumentStore {
             }
             RenderFilter::Sepia => {
                 data.par_chunks_exact_mut(4).for_each(|pixel| {
-                    let r = pixel[0] as f32;
-                    let g = pixel[1] as f32;
-                    let b = pixel[2] as f32;
-                    pixel[0] = (r * 0.393 + g * 0.769 + b * 0.189).min(255.0) as u8;
-                    pixel[1] = (r * 0.349 + g * 0.686 + b * 0.168).min(255.0) as u8;
-                    pixel[2] = (r * 0.272 + g * 0.534 + b * 0.131).min(255.0) as u8;
+                    let r = pixel[0] as u32;
+                    let g = pixel[1] as u32;
+                    let b = pixel[2] as u32;
+                    // Fixed-point sepia matrix (coefficients x1000), using the
+                    // same integer arithmetic as the grayscale filter.
+                    pixel[0] = ((r * 393 + g * 769 + b * 189) / 1000).min(255) as u8;
+                    pixel[1] = ((r * 349 + g * 686 + b * 168) / 1000).min(255) as u8;
+                    pixel[2] = ((r * 272 + g * 534 + b * 131) / 1000).min(255) as u8;
                 });
             }
             RenderFilter::Grayscale => {
@@ -1736,42 +1793,7 @@ impl DocumentStore {
             )))
         })?;
 
-        match format.to_lowercase().as_str() {
-            "md" | "markdown" => {
-                let mut out = String::new();
-                for page in &converted.pages {
-                    let _ = writeln!(out, "## Page {}\n\n{}\n", page.index + 1, page.text);
-                }
-                Ok(out)
-            }
-            "html" => {
-                let mut out = String::from(
-                    "<!DOCTYPE html>\n<html>\n<head>\n<meta charset=\"utf-8\">\n<title>Converted PDF</title>\n</head>\n<body>\n",
-                );
-                for page in &converted.pages {
-                    let escaped = page
-                        .text
-                        .replace('&', "&amp;")
-                        .replace('<', "&lt;")
-                        .replace('>', "&gt;");
-                    let _ = writeln!(
-                        out,
-                        "<section><h2>Page {}</h2><pre>{}</pre></section>",
-                        page.index + 1,
-                        escaped
-                    );
-                }
-                out.push_str("</body>\n</html>\n");
-                Ok(out)
-            }
-            _ => {
-                let mut out = String::new();
-                for page in &converted.pages {
-                    let _ = writeln!(out, "--- Page {} ---\n\n{}\n", page.index + 1, page.text);
-                }
-                Ok(out)
-            }
-        }
+        Ok(format_converted(&converted, format))
     }
 
     pub fn convert_pdf_doc(&self, path: &str, mode: &str, format: &str) -> PdfResult<String> {
@@ -1793,42 +1815,7 @@ impl DocumentStore {
             )))
         })?;
 
-        match format.to_lowercase().as_str() {
-            "md" | "markdown" => {
-                let mut out = String::new();
-                for page in &converted.pages {
-                    let _ = writeln!(out, "## Page {}\n\n{}\n", page.index + 1, page.text);
-                }
-                Ok(out)
-            }
-            "html" => {
-                let mut out = String::from(
-                    "<!DOCTYPE html>\n<html>\n<head>\n<meta charset=\"utf-8\">\n<title>Converted PDF</title>\n</head>\n<body>\n",
-                );
-                for page in &converted.pages {
-                    let escaped = page
-                        .text
-                        .replace('&', "&amp;")
-                        .replace('<', "&lt;")
-                        .replace('>', "&gt;");
-                    let _ = writeln!(
-                        out,
-                        "<section><h2>Page {}</h2><pre>{}</pre></section>",
-                        page.index + 1,
-                        escaped
-                    );
-                }
-                out.push_str("</body>\n</html>");
-                Ok(out)
-            }
-            _ => {
-                let mut out = String::new();
-                for page in &converted.pages {
-                    let _ = writeln!(out, "--- Page {} ---\n\n{}\n", page.index + 1, page.text);
-                }
-                Ok(out)
-            }
-        }
+        Ok(format_converted(&converted, format))
     }
 
     pub fn merge_documents(&self, paths: Vec<String>, output_path: String) -> PdfResult<String> {
@@ -1907,37 +1894,43 @@ impl DocumentStore {
             .and_then(|s| s.to_str())
             .unwrap_or("document");
 
-        let mut created_paths = Vec::new();
-
-        for &page_idx in &page_indices {
-            if page_idx >= total_pages {
-                continue;
-            }
-            // Build a delete list of all pages except the one we want.
-            let delete_indices: Vec<usize> = (0..total_pages).filter(|&i| i != page_idx).collect();
-
-            // Create a fresh writer per output page.
-            let mut writer = IncrementalWriter::new(base_data.clone())
-                .map_err(|e| PdfError::OpenFailed(e.to_string()))?;
+        // Every output page gets its own writer over a copy of the base bytes,
+        // with no shared state between pages — extract them in parallel while
+        // keeping the input order of `page_indices` in the returned paths.
+        let created_paths: Vec<Option<String>> = page_indices
+            .par_iter()
+            .map(|&page_idx| -> PdfResult<Option<String>> {
+                if page_idx >= total_pages {
+                    return Ok(None);
+                }
+                // Build a delete list of all pages except the one we want.
+                let delete_indices: Vec<usize> =
+                    (0..total_pages).filter(|&i| i != page_idx).collect();
 
-            writer
-                .delete_pages(&delete_indices)
-                .map_err(|e| PdfError::IoError(e.to_string()))?;
+                // Create a fresh writer per output page.
+                let mut writer = IncrementalWriter::new(base_data.clone())
+                    .map_err(|e| PdfError::OpenFailed(e.to_string()))?;
 
-            let out_bytes = {
-                let mut buf = std::io::Cursor::new(Vec::new());
                 writer
-                    .write(&mut buf)
+                    .delete_pages(&delete_indices)
                     .map_err(|e| PdfError::IoError(e.to_string()))?;
-                buf.into_inner()
-            };
 
-            let out_path = format!("{}/{}_page_{}.pdf", output_dir, filename, page_idx + 1);
-            std::fs::write(&out_path, &out_bytes).map_err(|e| PdfError::IoError(e.to_string()))?;
-            created_paths.push(out_path);
-        }
+                let out_bytes = {
+                    let mut buf = std::io::Cursor::new(Vec::new());
+                    writer
+                        .write(&mut buf)
+                        .map_err(|e| PdfError::IoError(e.to_string()))?;
+                    buf.into_inner()
+                };
+
+                let out_path = format!("{}/{}_page_{}.pdf", output_dir, filename, page_idx + 1);
+                std::fs::write(&out_path, &out_bytes)
+                    .map_err(|e| PdfError::IoError(e.to_string()))?;
+                Ok(Some(out_path))
+            })
+            .collect::<PdfResult<Vec<_>>>()?;
 
-        Ok(created_paths)
+        Ok(created_paths.into_iter().flatten().collect())
     }
 
     /// Burn redaction annotations permanently into the PDF, making the
@@ -2035,6 +2028,16 @@ impl DocumentStore {
     fn extract_form_fields_from_doc(&self, doc: &PdfDocument) -> Vec<FormField> {
         let mut fields = Vec::new();
         if let Some(acro) = doc.acro_form() {
+            // Index widget annotations by page in a single pass, instead of
+            // re-walking every page's annotation list once per field.
+            let mut widget_pages: HashMap<zpdf::ObjectId, usize> = HashMap::new();
+            for i in 0..doc.page_count() {
+                if let Ok(page) = doc.page(i) {
+                    for &annot_id in &page.annots {
+                        widget_pages.entry(annot_id).or_insert(i);
+                    }
+                }
+            }
             for f in &acro.fields {
                 let name = f.name.clone();
                 let variant = match f.kind {
@@ -2079,17 +2082,11 @@ impl DocumentStore {
                     },
                 };
 
-                let mut page_idx = 0;
-                if let Some(&widget_id) = f.widgets.first() {
-                    for i in 0..doc.page_count() {
-                        if let Ok(page) = doc.page(i) {
-                            if page.annots.contains(&widget_id) {
-                                page_idx = i;
-                                break;
-                            }
-                        }
-                    }
-                }
+                let page_idx = f
+                    .widgets
+                    .first()
+                    .and_then(|id| widget_pages.get(id).copied())
+                    .unwrap_or(0);
 
                 fields.push(FormField {
                     name,
@@ -2151,10 +2148,15 @@ impl DocumentStore {
                 .map_err(|e| PdfError::IoError(e.to_string()))?;
         }
 
-        let mut file =
+        // IncrementalWriter emits many small writes; buffer them so the filled
+        // form reaches the disk in large blocks instead of a syscall per object.
+        let file =
             std::fs::File::create(&output_path).map_err(|e| PdfError::IoError(e.to_string()))?;
+        let mut out = std::io::BufWriter::new(file);
         writer
-            .write(&mut file)
+            .write(&mut out)
+            .map_err(|e| PdfError::IoError(e.to_string()))?;
+        out.into_inner()
             .map_err(|e| PdfError::IoError(e.to_string()))?;
 
         Ok(output_path)
@@ -2702,6 +2704,52 @@ impl DocumentStore {
     }
 }
 
+const HTML_PROLOGUE: &str = "<!DOCTYPE html>\n<html>\n<head>\n<meta charset=\"utf-8\">\n<title>Converted PDF</title>\n</head>\n<body>\n";
+
+/// Render converted pages into the requested output format.
+/// Shared by the by-id and by-path conversion entry points; the output buffer
+/// is sized from the page texts up front so appends never reallocate.
+fn format_converted(converted: &zpdf::ConvertedDocument, format: &str) -> String {
+    let text_len: usize = converted.pages.iter().map(|p| p.text.len()).sum();
+    let mut out = String::with_capacity(text_len + converted.pages.len() * 64 + 128);
+    match format.to_lowercase().as_str() {
+        "md" | "markdown" => {
+            for page in &converted.pages {
+                let _ = writeln!(out, "## Page {}\n\n{}\n", page.index + 1, page.text);
+            }
+        }
+        "html" => {
+            out.push_str(HTML_PROLOGUE);
+            for page in &converted.pages {
+                let _ = write!(out, "<section><h2>Page {}</h2><pre>", page.index + 1);
+                escape_html_into(&mut out, &page.text);
+                out.push_str("</pre></section>\n");
+            }
+            out.push_str("</body>\n</html>\n");
+        }
+        _ => {
+            for page in &converted.pages {
+                let _ = writeln!(out, "--- Page {} ---\n\n{}\n", page.index + 1, page.text);
+            }
+        }
+    }
+    out
+}
+
+/// Escape `&`, `<`, `>` for embedding page text in HTML output.
+/// Single pass over the text, instead of three chained `replace()` calls
+/// that each rescan and reallocate the whole page.
+fn escape_html_into(out: &mut String, text: &str) {
+    for c in text.chars() {
+        match c {
+            '&' => out.push_str("&amp;"),
+            '<' => out.push_str("&lt;"),
+            '>' => out.push_str("&gt;"),
+            _ => out.push(c),
+        }
+    }
+}
+
 pub fn create_render_cache(cache_size: u64, max_memory_mb: u64) -> SharedRenderCache {
     let mb = (max_memory_mb * 1024 * 1024) as usize;
     Arc::new(RenderCache::new(
@@ -2996,6 +3044,23 @@ mod tests {
         assert_eq!(data[2], 100);
     }
 
+    #[test]
+    fn test_apply_filter_sepia() {
+        let mut data = vec![100, 150, 200, 255];
+        DocumentStore::apply_filter(&mut data, RenderFilter::Sepia);
+        assert_eq!(data[0], ((100 * 393 + 150 * 769 + 200 * 189) / 1000) as u8);
+        assert_eq!(data[1], ((100 * 349 + 150 * 686 + 200 * 168) / 1000) as u8);
+        assert_eq!(data[2], ((100 * 272 + 150 * 534 + 200 * 131) / 1000) as u8);
+    }
+
+    #[test]
+    fn test_apply_filter_sepia_saturates() {
+        let mut data = vec![255, 255, 255, 255];
+        DocumentStore::apply_filter(&mut data, RenderFilter::Sepia);
+        assert_eq!(data[0], 255);
+        assert_eq!(data[1], 255);
+    }
+
     #[test]
     fn test_apply_filter_grayscale() {
         let mut data = vec![100, 150, 200, 255];
@@ -3131,6 +3196,32 @@ mod tests {
         assert_eq!(inverted, RenderFilter::Inverted);
     }
 
+    #[test]
+    fn test_search_repeated_queries_consistent() {
+        let mut store = DocumentStore::new(create_render_cache(10, 0));
+        let mut path = std::path::PathBuf::from(env!("CARGO_MANIFEST_DIR"));
+        path.push("tests");
+        path.push("test_document.pdf");
+        let doc_id = DocumentId(1);
+        store
+            .open_document(path.to_str().unwrap(), None, doc_id)
+            .unwrap();
+        // Second query hits the span cache; every hit must match the cold
+        // run exactly, not just the overall count.
+        let first = store.search(doc_id, "e").unwrap();
+        let second = store.search(doc_id, "e").unwrap();
+        assert!(!first.is_empty());
+        assert_eq!(first.len(), second.len());
+        for (a, b) in first.iter().zip(second.iter()) {
+            assert_eq!(a.page_index, b.page_index);
+            assert_eq!(a.text, b.text);
+            assert_eq!(a.x, b.x);
+            assert_eq!(a.y, b.y);
+            assert_eq!(a.width, b.width);
+            assert_eq!(a.height, b.height);
+        }
+    }
+
     #[test]
     fn test_crash_investigation() {
         let handle = std::thread::spawn(move || {
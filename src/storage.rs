@@ -1,18 +1,51 @@
 use crate::models::{AppSettings, AppTheme, RecentFile, SessionData};
+use std::collections::HashMap;
 use std::fs;
 use std::io::{self, Write};
 use std::path::{Path, PathBuf};
+use std::sync::{Mutex, OnceLock};
 use time::OffsetDateTime;
 
+/// Relative-time labels keyed by the minute bucket of the difference,
+/// `(now - unix_secs) / 60`. The welcome screen rebuilds this label for
+/// every recent file on every view pass; between one minute and the 30-day
+/// date cutoff every unit boundary timeago can hit (60, 3600, 86400,
+/// 604800) is a multiple of 60, so the label is a pure function of the
+/// bucket and an entry can never go stale. The map is bounded by the
+/// number of minute buckets under 30 days.
+static TIME_AGO_CACHE: OnceLock<Mutex<HashMap<u64, String>>> = OnceLock::new();
+
 pub fn time_ago(unix_secs: u64) -> String {
-    if unix_secs == u64::MAX {
-        return "unknown".into();
-    }
     let now_ts = OffsetDateTime::now_utc().unix_timestamp();
     if now_ts < 0 {
         return "unknown".into();
     }
     let now = now_ts as u64;
+    // Sub-minute labels change at second granularity and 30-day-plus ones
+    // are absolute dates (a function of the timestamp, not the diff); only
+    // the minute-granular range in between is memoizable.
+    let diff = now.saturating_sub(unix_secs);
+    if unix_secs > now || !(60..30 * 24 * 3600).contains(&diff) {
+        return format_time_ago(unix_secs, now);
+    }
+    let bucket = diff / 60;
+    let cache = TIME_AGO_CACHE.get_or_init(|| Mutex::new(HashMap::new()));
+    if let Ok(mut entries) = cache.lock() {
+        if let Some(s) = entries.get(&bucket) {
+            return s.clone();
+        }
+        let s = format_time_ago(unix_secs, now);
+        entries.insert(bucket, s.clone());
+        s
+    } else {
+        format_time_ago(unix_secs, now)
+    }
+}
+
+fn format_time_ago(unix_secs: u64, now: u64) -> String {
+    if unix_secs == u64::MAX {
+        return "unknown".into();
+    }
     if unix_secs > now {
         return "unknown".into();
     }
@@ -66,6 +99,14 @@ pub fn get_config_dir() -> PathBuf {
 
 fn atomic_write(path: &Path, data: &str) -> io::Result<()> {
     use atomicwrites::{AllowOverwrite, AtomicFile};
+    // Skip the temp-file-and-rename dance when the content on disk is already
+    // byte-identical: steady-state settings/session saves are no-ops, and
+    // rewriting them would only churn mtimes and wake file watchers.
+    if let Ok(existing) = fs::read(path) {
+        if existing == data.as_bytes() {
+            return Ok(());
+        }
+    }
     let af = AtomicFile::new(path, AllowOverwrite);
     af.write(|f| f.write_all(data.as_bytes()))
         .map_err(|e| match e {
@@ -255,6 +296,13 @@ mod tests {
         assert!(result.contains("day"));
     }
 
+    #[test]
+    fn test_time_ago_repeated_calls_consistent() {
+        let two_mins_ago = OffsetDateTime::now_utc().unix_timestamp() as u64 - 120;
+        // Second call is served from the memo cache and must match the first.
+        assert_eq!(time_ago(two_mins_ago), time_ago(two_mins_ago));
+    }
+
     #[test]
     fn test_time_ago_unknown_timestamp() {
         let result = time_ago(u64::MAX);
@@ -360,6 +408,28 @@ mod tests {
         let _ = std::fs::remove_file(&test_path);
     }
 
+    #[test]
+    fn test_atomic_write_skips_identical_content() {
+        let temp_dir = std::env::temp_dir();
+        let timestamp = std::time::SystemTime::now()
+            .duration_since(std::time::UNIX_EPOCH)
+            .unwrap_or_default()
+            .as_nanos();
+        let test_path = temp_dir.join(format!("test_atomic_skip_{}.txt", timestamp));
+
+        atomic_write(&test_path, "same content").unwrap();
+        let mtime_first = std::fs::metadata(&test_path).unwrap().modified().unwrap();
+
+        std::thread::sleep(std::time::Duration::from_millis(50));
+        atomic_write(&test_path, "same content").unwrap();
+        let mtime_second = std::fs::metadata(&test_path).unwrap().modified().unwrap();
+
+        // Identical content must not be rewritten (mtime untouched).
+        assert_eq!(mtime_first, mtime_second);
+
+        let _ = std::fs::remove_file(&test_path);
+    }
+
     #[test]
     fn test_get_config_dir_returns_path() {
         let dir = get_config_dir();
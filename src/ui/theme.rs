@@ -179,16 +179,24 @@ pub fn input_field(_theme: &iced::Theme) -> iced::widget::container::Style {
 pub fn hex_to_rgb(hex: &str) -> (f32, f32, f32) {
     let hex = hex.trim();
     let hex_digits = hex.strip_prefix('#').unwrap_or(hex);
-    if hex_digits.len() != 6 {
+    if hex_digits.len() != 6 || !hex_digits.bytes().all(|b| b.is_ascii_hexdigit()) {
         return (0.0, 0.0, 0.0);
     }
-    let input = format!("#{hex_digits}");
-    csscolorparser::parse(&input)
-        .map(|c| {
-            let arr = c.to_array();
-            (arr[0] as f32, arr[1] as f32, arr[2] as f32)
-        })
-        .unwrap_or((0.0, 0.0, 0.0))
+    // Only #RRGGBB ever reaches this point (from_str_radix alone would also
+    // accept a leading sign), so parse the three channel bytes directly
+    // instead of allocating a string for the general CSS color parser.
+    match (
+        u8::from_str_radix(&hex_digits[0..2], 16),
+        u8::from_str_radix(&hex_digits[2..4], 16),
+        u8::from_str_radix(&hex_digits[4..6], 16),
+    ) {
+        (Ok(r), Ok(g), Ok(b)) => (
+            f32::from(r) / 255.0,
+            f32::from(g) / 255.0,
+            f32::from(b) / 255.0,
+        ),
+        _ => (0.0, 0.0, 0.0),
+    }
 }
 
 #[cfg(test)]
@@ -276,6 +284,15 @@ mod tests {
         assert_eq!(b, 0.0);
     }
 
+    #[test]
+    fn test_hex_to_rgb_invalid_signs() {
+        // from_str_radix would accept the leading '+' in each pair.
+        let (r, g, b) = hex_to_rgb("#+a+b+c");
+        assert_eq!(r, 0.0);
+        assert_eq!(g, 0.0);
+        assert_eq!(b, 0.0);
+    }
+
     #[test]
     fn test_hex_to_rgb_lowercase() {
         let (r, g, b) = hex_to_rgb("#aabbcc");